@@ -39,7 +39,7 @@ class SuperAutoPetsEnv(gym.Env):
     ALL_FOODS = ["food-apple", "food-honey", "food-cupcake", "food-meat-bone", "food-sleeping-pill", "food-garlic", "food-salad-bowl", "food-canned-food", "food-pear", "food-chili", "food-chocolate", "food-sushi", "food-melon", "food-mushroom", "food-pizza", "food-steak", "food-milk"]
     ALL_STATUSES = ["status-weak", "status-coconut-shield", "status-honey-bee", "status-bone-attack", "status-garlic-armor", "status-splash-attack", "status-melon-armor", "status-extra-life", "status-steak-attack", "status-poison-attack"]
 
-    def __init__(self, opponent_generator, valid_actions_only, manual_battles=False):
+    def __init__(self, opponent_generator, valid_actions_only=False, manual_battles=False):
         """
         Create a gym for Super Auto Pets.
         :param opponent_generator: Function that generates the opponents to play against when a shop turn is ended. This
@@ -49,7 +49,8 @@ class SuperAutoPetsEnv(gym.Env):
         This is helpful when action masks are used
         :param manual_battles: bool. If set to true, battles will not be manually executed. The caller is responsible
         for starting the next turn after a turn is ended. This is helpful when battles are irrelevant to task at hand,
-        or when battles are manually controlled (eg. in an arena with multiple agents)
+        or when battles are manually controlled (eg. in an arena with multiple agents). The initial state is not encoded
+        on creation, call reset() to get the first observation
         """
         super(SuperAutoPetsEnv, self).__init__()
 
@@ -75,7 +76,11 @@ class SuperAutoPetsEnv(gym.Env):
         self.opponents = None
         self.bad_action_reward_sum = 0
 
-        self.reset()
+        if manual_battles:
+            # Skip encoding the initial state. Callers that need an observation should call reset()
+            self._reset_player()
+        else:
+            self.reset()
 
     def step(self, action):
         self.resolve_action(action)
@@ -121,9 +126,7 @@ class SuperAutoPetsEnv(gym.Env):
 
 
     def reset(self, *, seed: Optional[int] = None, return_info: bool = False, options: Optional[dict] = None,):
-        self.player = Player()
-        self.just_froze = False
-        self.last_action = None
+        self._reset_player()
 
         if not self.manual_battles:
             self.opponents = self.opponent_generator(25)
@@ -132,6 +135,12 @@ class SuperAutoPetsEnv(gym.Env):
 
         return self._encode_state()
 
+    def _reset_player(self):
+        """ Start a new game for the player without generating opponents or encoding the state """
+        self.player = Player()
+        self.just_froze = False
+        self.last_action = None
+
     def render(self, mode='human', close=False):
         print(self.player)
         print(f"just_froze: {self.just_froze}")
@@ -0,0 +1,122 @@
+from typing import Dict, List, NamedTuple, Union
+
+from sapai import Battle, Team
+
+from sapai_gym import SuperAutoPetsEnv
+
+# Battle results are from the perspective of the first team. Swap wins and losses for the second team
+_MIRRORED_OUTCOME = {0: 1, 1: 0, 2: 2}
+
+
+class EpisodeResult(NamedTuple):
+    """
+    Result of a headless game between two agents.
+    teams_a / teams_b: Team of each side at the end of every shop phase, starting from turn 1
+    outcomes: Battle result of every turn from the perspective of side a (0 = win, 1 = loss, 2 = draw)
+    """
+    teams_a: List[Team]
+    teams_b: List[Team]
+    outcomes: List[int]
+    wins_a: int
+    wins_b: int
+    lives_a: int
+    lives_b: int
+    turns: int
+
+
+def play_shop_phase(env: SuperAutoPetsEnv, ai):
+    """
+    Play a full shop phase for env.player, ending with end_turn. Actions chosen by the ai are played directly, without
+    the validity checks in resolve_action, so the ai must only choose from the actions it is given.
+    :param env: Environment whose player should act. Battles are not resolved and the next turn is not started
+    :param ai: Agent with the same signature as the agents in sapai_gym.ai.baselines
+    """
+    while True:
+        actions = env._avail_actions()
+        chosen_action = ai(env.player, actions)
+        action_to_play = actions[chosen_action]
+        action_to_play[0](*action_to_play[1:])
+        env.last_action = chosen_action
+
+        if SuperAutoPetsEnv._get_action_name(action_to_play) == "end_turn":
+            return
+
+
+def _play_episode(env_a: SuperAutoPetsEnv, env_b: SuperAutoPetsEnv, agent_a, agent_b) -> EpisodeResult:
+    teams_a = list()
+    teams_b = list()
+    outcomes = list()
+
+    while True:
+        play_shop_phase(env_a, agent_a)
+        play_shop_phase(env_b, agent_b)
+        teams_a.append(Team.from_state(env_a.player.team.state))
+        teams_b.append(Team.from_state(env_b.player.team.state))
+
+        outcome = Battle(env_a.player.team, env_b.player.team).battle()
+        env_a._player_fight_outcome(outcome)
+        env_b._player_fight_outcome(_MIRRORED_OUTCOME[outcome])
+        outcomes.append(outcome)
+        env_a.player.start_turn()
+        env_b.player.start_turn()
+
+        if env_a.is_done() or env_b.is_done():
+            break
+
+    return EpisodeResult(
+        teams_a=teams_a,
+        teams_b=teams_b,
+        outcomes=outcomes,
+        wins_a=env_a.player.wins,
+        wins_b=env_b.player.wins,
+        lives_a=env_a.player.lives,
+        lives_b=env_b.player.lives,
+        turns=len(outcomes),
+    )
+
+
+def run_episodes(agent_a, agent_b, num_games: int) -> List[EpisodeResult]:
+    """
+    Play full games between two agents without encoding observations or building action masks. This is much faster
+    than stepping through SuperAutoPetsEnv and is meant for data generation and evaluation of heuristic agents.
+    :param agent_a: Agent for side a
+    :param agent_b: Agent for side b
+    :param num_games: Number of games to play
+    :return: Result of each game
+    """
+    env_a = SuperAutoPetsEnv(None, manual_battles=True)
+    env_b = SuperAutoPetsEnv(None, manual_battles=True)
+
+    results = list()
+    for _ in range(num_games):
+        env_a._reset_player()
+        env_b._reset_player()
+        results.append(_play_episode(env_a, env_b, agent_a, agent_b))
+    return results
+
+
+def run_episode(agent_a, agent_b) -> EpisodeResult:
+    """
+    Play a single headless game between two agents. See run_episodes
+    """
+    return run_episodes(agent_a, agent_b, 1)[0]
+
+
+def summarize_episodes(results: List[EpisodeResult]) -> Dict[str, Union[int, float]]:
+    """
+    Aggregate stats over headless games, from the perspective of side a
+    :param results: Results returned by run_episodes
+    :return: Summary stats
+    """
+    num_games = len(results)
+    all_outcomes = [outcome for result in results for outcome in result.outcomes]
+    return {
+        "games": num_games,
+        "battles": len(all_outcomes),
+        "battle_wins": all_outcomes.count(0),
+        "battle_losses": all_outcomes.count(1),
+        "battle_draws": all_outcomes.count(2),
+        "mean_wins_a": sum(r.wins_a for r in results) / num_games if num_games else 0,
+        "mean_wins_b": sum(r.wins_b for r in results) / num_games if num_games else 0,
+        "mean_turns": sum(r.turns for r in results) / num_games if num_games else 0,
+    }
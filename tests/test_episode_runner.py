@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from sapai import Team
+from sapai_gym import SuperAutoPetsEnv
+from sapai_gym.ai import baselines
+from sapai_gym.headless.episode_runner import run_episode, run_episodes, summarize_episodes
+
+
+def _end_turn_agent(player_to_act, actions):
+    return SuperAutoPetsEnv.ACTION_BASE_NUM["end_turn"]
+
+
+def _empty_team_opp_generator(num_turns):
+    return [Team() for _ in range(num_turns)]
+
+
+class TestEpisodeRunner(TestCase):
+    def test_run_episode(self):
+        result = run_episode(baselines.random_agent, baselines.biggest_numbers_horizontal_scaling_agent)
+
+        self.assertEqual(result.turns, len(result.outcomes))
+        self.assertEqual(result.turns, len(result.teams_a))
+        self.assertEqual(result.turns, len(result.teams_b))
+        self.assertEqual(result.wins_a, result.outcomes.count(0))
+        self.assertEqual(result.wins_b, result.outcomes.count(1))
+        self.assertGreater(result.turns, 0)
+
+    def test_empty_team_loses_every_battle(self):
+        turns_played = list()
+
+        def recording_agent(player_to_act, actions):
+            if not turns_played or turns_played[-1] != player_to_act.turn:
+                turns_played.append(player_to_act.turn)
+            return baselines.biggest_numbers_vertical_scaling_agent(player_to_act, actions)
+
+        result = run_episode(recording_agent, _end_turn_agent)
+
+        # Side b never buys a pet, so it loses every battle and runs out of lives on turn 6 (10 - 1 - 1 - 2 - 2 - 3 - 3)
+        self.assertEqual(turns_played, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(result.outcomes, [0] * 6)
+        self.assertEqual(result.turns, 6)
+        self.assertEqual(len(result.teams_a), 6)
+        self.assertEqual(result.wins_a, 6)
+        self.assertEqual(result.wins_b, 0)
+        self.assertEqual(result.lives_b, 0)
+
+    def test_turn_cap_matches_env(self):
+        # Neither side buys a pet, so every battle is between empty teams and the game runs until the turn cap
+        result = run_episode(_end_turn_agent, _end_turn_agent)
+
+        env = SuperAutoPetsEnv(_empty_team_opp_generator, valid_actions_only=True)
+        env.reset()
+        env_battles = 0
+        done = False
+        while not done:
+            _, _, done, _ = env.step(SuperAutoPetsEnv.ACTION_BASE_NUM["end_turn"])
+            env_battles += 1
+
+        self.assertEqual(result.turns, env_battles)
+        self.assertEqual(result.wins_a, env.player.wins)
+        self.assertEqual(result.lives_a, env.player.lives)
+
+    def test_run_episodes(self):
+        results = run_episodes(baselines.biggest_numbers_vertical_scaling_agent,
+                               baselines.biggest_numbers_horizontal_scaling_agent, 3)
+        self.assertEqual(len(results), 3)
+
+        summary = summarize_episodes(results)
+        self.assertEqual(summary["games"], 3)
+        self.assertEqual(summary["battles"], sum(r.turns for r in results))
+        self.assertEqual(summary["battle_wins"] + summary["battle_losses"] + summary["battle_draws"], summary["battles"])
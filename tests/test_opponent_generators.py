@@ -1,7 +1,9 @@
 from unittest import TestCase
 
 from sapai import Team
-from sapai_gym.opponent_gen.opponent_generators import random_opp_generator, biggest_numbers_horizontal_opp_generator
+from sapai_gym.ai import baselines
+from sapai_gym.opponent_gen.opponent_generators import opp_generator, random_opp_generator, \
+    biggest_numbers_horizontal_opp_generator
 
 
 class TestOpponentGenerators(TestCase):
@@ -16,6 +18,20 @@ class TestOpponentGenerators(TestCase):
         # Check that the team is always getting stronger
         self.assertEqual(scores, sorted_scores)
 
+    def test_opp_generator_plays_one_shop_phase_per_turn(self):
+        shop_turns = list()
+
+        def recording_agent(player_to_act, actions):
+            if not shop_turns or shop_turns[-1] != player_to_act.turn:
+                shop_turns.append(player_to_act.turn)
+            return baselines.biggest_numbers_horizontal_scaling_agent(player_to_act, actions)
+
+        opponents = opp_generator(25, recording_agent)
+
+        self.assertEqual(len(opponents), 25)
+        self.assertEqual(len(shop_turns), 25)
+        self.assertEqual(shop_turns, list(range(shop_turns[0], shop_turns[0] + 25)))
+
     @staticmethod
     def map_team_to_total_attack_and_health(team: Team):
         total = 0